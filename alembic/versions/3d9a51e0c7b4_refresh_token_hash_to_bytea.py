@@ -0,0 +1,43 @@
+"""refresh token hash to bytea
+
+Revision ID: 3d9a51e0c7b4
+Revises: b7e2c41f9a30
+Create Date: 2026-10-17 12:41:07.593120
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3d9a51e0c7b4'
+down_revision: Union[str, None] = 'b7e2c41f9a30'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # сессии с Argon2id-хешем (до перехода на HMAC) не находятся поиском по хешу
+    # и не декодируются из hex - удаляем их до смены типа столбца
+    op.execute("DELETE FROM user_sessions WHERE refresh_token_hash !~ '^[0-9a-f]{64}$'")
+    op.alter_column('user_sessions', 'refresh_token_hash',
+               existing_type=sa.VARCHAR(length=128),
+               type_=sa.LargeBinary(length=32),
+               comment='Хэш токена обновления (HMAC-SHA256, сырой дайджест)',
+               existing_comment='Хэш токена обновления (HMAC-SHA256)',
+               existing_nullable=False,
+               postgresql_using="decode(refresh_token_hash, 'hex')")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column('user_sessions', 'refresh_token_hash',
+               existing_type=sa.LargeBinary(length=32),
+               type_=sa.String(length=128),
+               comment='Хэш токена обновления (HMAC-SHA256)',
+               existing_comment='Хэш токена обновления (HMAC-SHA256, сырой дайджест)',
+               existing_nullable=False,
+               postgresql_using="encode(refresh_token_hash, 'hex')")
@@ -0,0 +1,33 @@
+"""auth lookup indexes
+
+Revision ID: b7e2c41f9a30
+Revises: 9c859fd8c955
+Create Date: 2026-10-17 12:04:51.218734
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e2c41f9a30'
+down_revision: Union[str, None] = '9c859fd8c955'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # uq_users_username уже поддерживается собственным уникальным индексом
+    op.drop_index('ix_users_username', table_name='users')
+    op.drop_index(op.f('ix_user_sessions_refresh_token_hash'), table_name='user_sessions')
+    op.create_index(op.f('ix_user_sessions_refresh_token_hash'), 'user_sessions', ['refresh_token_hash'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_user_sessions_refresh_token_hash'), table_name='user_sessions')
+    op.create_index(op.f('ix_user_sessions_refresh_token_hash'), 'user_sessions', ['refresh_token_hash'], unique=False)
+    op.create_index('ix_users_username', 'users', ['username'], unique=False)
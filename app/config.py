@@ -59,6 +59,26 @@ class Settings(BaseSettings):
         Название базы данных.
     POSTGRES_DSN : PostgresDsn
         Строка подключения (ссылка) к базе данных.
+    POSTGRES_POOL_SIZE : int
+        Количество постоянных подключений в пуле SQLAlchemy.
+    POSTGRES_MAX_OVERFLOW : int
+        Количество подключений, открываемых сверх `POSTGRES_POOL_SIZE`
+        при пиковой нагрузке.
+    POSTGRES_POOL_TIMEOUT : int
+        Время в секундах ожидания свободного подключения из пула.
+    POSTGRES_POOL_RECYCLE : int
+        Время в секундах, после которого подключение пересоздаётся.
+    POSTGRES_POOL_PRE_PING : bool
+        Проверять ли подключение запросом перед выдачей из пула.
+        Стоит лишнего round-trip на каждый запрос; устаревшие подключения
+        и так отсекаются через `POSTGRES_POOL_RECYCLE`.
+    POSTGRES_STATEMENT_CACHE_SIZE : int
+        Размер кэша подготовленных выражений asyncpg на одно подключение.
+        Повторные запросы той же формы не проходят Parse/Describe заново.
+    POSTGRES_ECHO : bool
+        Логировать ли все выполняемые SQL-запросы (и параметры).
+        Предназначено для диагностики N+1 и лишних запросов
+        в development-окружении.
     REDIS_HOST : str
         Хост Redis.
     REDIS_PASSWORD : str
@@ -139,6 +159,14 @@ class Settings(BaseSettings):
 
     POSTGRES_DSN: PostgresDsn
 
+    POSTGRES_POOL_SIZE: int = 10
+    POSTGRES_MAX_OVERFLOW: int = 10
+    POSTGRES_POOL_TIMEOUT: int = 30
+    POSTGRES_POOL_RECYCLE: int = 1800
+    POSTGRES_POOL_PRE_PING: bool = False
+    POSTGRES_STATEMENT_CACHE_SIZE: int = 500
+    POSTGRES_ECHO: bool = False
+
     REDIS_HOST: str
     REDIS_PASSWORD: str
     REDIS_PORT: int
@@ -23,6 +23,12 @@ DISPLAY_NAME_MIN_LENGTH = 1
 DISPLAY_NAME_MAX_LENGTH = 32
 """Максимальная длина отображаемого имени пользователя в символах."""
 
+TITLE_MAX_LENGTH = 64
+"""Максимальная длина наименования альбома, файла или заметки в символах."""
+
+URL_MAX_LENGTH = 512
+"""Максимальная длина хранимого URL (обложки альбома, аватара) в символах."""
+
 DEFAULT_OFFSET = 0
 """Значение смещения по умолчанию для пагинации."""
 
@@ -12,8 +12,8 @@ async def get_partner_id(
 ) -> UUID | None:
     """Зависимость, которая возвращает partner_id для текущего пользователя.
 
-    Извлекает идентификатор партнёра из кэша Redis или, при его отсутствии,
-    из базы данных через CoupleService. Результат кэшируется.
+    Получает идентификатор партнёра через `CoupleService.get_partner_id`,
+    не загружая данные самой пары и её участников.
 
     Parameters
     ----------
@@ -31,9 +31,7 @@ async def get_partner_id(
     UUID | None
         Идентификатор партнёра, или None если пользователь не состоит в паре.
     """
-    couple = await services.couple.get_couple(payload.sub)
-
-    return couple.partner.id if couple else None
+    return await services.couple.get_partner_id(payload.sub)
 
 
 PartnerIdDependency = Annotated[UUID | None, Depends(get_partner_id)]
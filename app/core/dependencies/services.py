@@ -150,7 +150,7 @@ class ServiceManager:
             Экземпляр сервиса пар пользователей.
         """
         if self._couple_service is None:
-            self._couple_service = CoupleService(self._uow)
+            self._couple_service = CoupleService(self._uow, self._redis_client)
 
         return self._couple_service
 
@@ -1,20 +1,16 @@
+import asyncio
 import hashlib
 import hmac
 import os
 import uuid
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from functools import cache
 from typing import Any, Literal, overload
 from uuid import UUID
 
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
-from cryptography.hazmat.primitives.serialization import (
-    Encoding,
-    NoEncryption,
-    PrivateFormat,
-    PublicFormat,
-)
-from jose import jwt
+from jose import jwk, jwt
 from passlib.context import CryptContext
 
 from app.config import get_settings
@@ -29,6 +25,18 @@ from app.schemas.dto.payload import (
 
 _settings = get_settings()
 
+_SIGNING_KEY = jwk.construct(_settings.PRIVATE_SIGNATURE_KEY, _settings.JWT_ALGORITHM)
+"""Подготовленный ключ подписи JWT (без сериализации в PEM на каждый вызов)."""
+
+_VERIFYING_KEY = jwk.construct(_settings.PUBLIC_SIGNATURE_KEY, _settings.JWT_ALGORITHM)
+"""Подготовленный ключ проверки подписи JWT."""
+
+_ACCESS_PAYLOAD_CACHE_SIZE = 4096
+"""Максимальное количество проверенных access-токенов в кэше процесса."""
+
+_access_payloads: dict[str, AccessTokenPayload] = {}
+"""Кэш payload уже проверенных access-токенов (в порядке добавления)."""
+
 
 def _jwt_encode(payload: AnyTokenPayload) -> str:
     """Кодирует переданный словарь в JWT.
@@ -45,11 +53,7 @@ def _jwt_encode(payload: AnyTokenPayload) -> str:
     """
     return jwt.encode(
         payload.to_jwt_payload(),
-        key=_settings.PRIVATE_SIGNATURE_KEY.private_bytes(
-            encoding=Encoding.PEM,
-            format=PrivateFormat.PKCS8,
-            encryption_algorithm=NoEncryption(),
-        ),
+        key=_SIGNING_KEY,
         algorithm=_settings.JWT_ALGORITHM,
     )
 
@@ -76,18 +80,37 @@ def jwt_decode(token: str, token_type: TokenType) -> AnyTokenPayload:
     -------
     AnyTokenPayload
         Словарь с информацией из JWT.
+
+    Notes
+    -----
+    Access-токен повторно предъявляется на каждом запросе в течение
+    всего срока жизни, поэтому payload уже проверенных access-токенов
+    кэшируется в процессе и подпись проверяется один раз. Запись
+    используется, только пока токен не истёк, - истёкший токен снова
+    проходит `jwt.decode` и получает штатную ошибку. Проверка отзыва
+    токена выполняется вызывающей стороной и кэшем не затрагивается.
     """
+    if token_type == "access" and (cached := _access_payloads.get(token)):
+        if cached.exp > datetime.now(timezone.utc):
+            return cached
+
+        del _access_payloads[token]
+
     decoded = jwt.decode(
         token,
-        key=_settings.PUBLIC_SIGNATURE_KEY.public_bytes(
-            Encoding.PEM, PublicFormat.SubjectPublicKeyInfo
-        ),
+        key=_VERIFYING_KEY,
         algorithms=[_settings.JWT_ALGORITHM],
     )
 
     match token_type:
         case "access":
-            return AccessTokenPayload.model_validate(decoded)
+            payload = AccessTokenPayload.model_validate(decoded)
+
+            if len(_access_payloads) >= _ACCESS_PAYLOAD_CACHE_SIZE:
+                del _access_payloads[next(iter(_access_payloads))]
+            _access_payloads[token] = payload
+
+            return payload
         case "refresh":
             return RefreshTokenPayload.model_validate(decoded)
 
@@ -400,9 +423,80 @@ def verify(
     return _pwd_context.verify(secret, hashed, scheme, category)
 
 
+async def hash_async(secret: str | bytes) -> str:
+    """Хеширует секрет в пуле потоков, не блокируя event loop.
+
+    Argon2 намеренно медленный (десятки миллисекунд), а argon2-cffi
+    отпускает GIL на время вычисления, поэтому хеширование в отдельном
+    потоке не задерживает остальные корутины воркера.
+
+    Parameters
+    ----------
+    secret : str | bytes
+        Секрет для хеширования.
+
+    Returns
+    -------
+    str
+        Хэш секрета по схеме по умолчанию.
+    """
+    return await asyncio.to_thread(_pwd_context.hash, secret)
+
+
+async def verify_async(secret: str | bytes, hashed: str | bytes) -> bool:
+    """Проверяет секрет на соответствие хешу в пуле потоков.
+
+    Parameters
+    ----------
+    secret : str | bytes
+        Секрет для проверки.
+    hashed : str | bytes
+        Хэш секрета.
+
+    Returns
+    -------
+    bool
+        `True`, если хеш секрета соответствует переданному секрету, в ином случае `False`.
+    """
+    return await asyncio.to_thread(_pwd_context.verify, secret, hashed)
+
+
+@cache
+def _token_hmac(secret_key: bytes) -> hmac.HMAC:
+    """Возвращает HMAC-SHA256, заранее инициализированный ключом.
+
+    Подготовка ключа (дополнение до блока и два хеша ipad/opad)
+    выполняется один раз на ключ; `hash_token` лишь копирует
+    готовое состояние.
+
+    Parameters
+    ----------
+    secret_key : bytes
+        Секретный ключ для HMAC.
+
+    Returns
+    -------
+    hmac.HMAC
+        Объект HMAC без данных, пригодный только для `copy()`.
+
+    Raises
+    ------
+    WeakServerSecretException
+        Если длина секретного ключа меньше `HMAC_MIN_KEY_LENGTH` байт.
+    """
+    if len(secret_key) < HMAC_MIN_KEY_LENGTH:
+        raise WeakServerSecretException(
+            detail=(
+                f"HMAC secret key is too weak: expected at least {HMAC_MIN_KEY_LENGTH} bytes, got {len(secret_key)}."
+            )
+        )
+
+    return hmac.new(secret_key, digestmod=hashlib.sha256)
+
+
 def hash_token(
     token: str, secret_key: bytes = _settings.HMAC_SECRET_KEY.encode()
-) -> str:
+) -> bytes:
     """Создаёт детерминированный HMAC-SHA256 хеш токена.
 
     В отличие от `hash_()`, результат детерминирован - одинаковый токен
@@ -420,22 +514,18 @@ def hash_token(
 
     Returns
     -------
-    str
-        HMAC-SHA256 хеш токена в виде hex-строки.
+    bytes
+        HMAC-SHA256 хеш токена в виде сырого 32-байтного дайджеста.
 
     Raises
     ------
     WeakServerSecretException
         Если длина секретного ключа меньше `HMAC_MIN_KEY_LENGTH` байт.
     """
-    if len(secret_key) < HMAC_MIN_KEY_LENGTH:
-        raise WeakServerSecretException(
-            detail=(
-                f"HMAC secret key is too weak: expected at least {HMAC_MIN_KEY_LENGTH} bytes, got {len(secret_key)}."
-            )
-        )
+    token_hmac = _token_hmac(secret_key).copy()
+    token_hmac.update(token.encode())
 
-    return hmac.new(secret_key, token.encode(), hashlib.sha256).hexdigest()
+    return token_hmac.digest()
 
 
 def encrypt_data(
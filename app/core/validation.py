@@ -2,7 +2,12 @@ import re
 import unicodedata
 from typing import Annotated
 
-from pydantic import AfterValidator, StringConstraints
+from pydantic import (
+    AfterValidator,
+    HttpUrl,
+    StringConstraints,
+    TypeAdapter,
+)
 from pydantic_core import PydanticCustomError
 
 from app.core.consts import (
@@ -10,6 +15,8 @@ from app.core.consts import (
     DISPLAY_NAME_MIN_LENGTH,
     PASSWORD_MIN_LENGTH,
     SPECIAL_CHAR_PATTERN,
+    TITLE_MAX_LENGTH,
+    URL_MAX_LENGTH,
     USERNAME_MAX_LENGTH,
     USERNAME_MIN_LENGTH,
     USERNAME_PATTERN,
@@ -35,6 +42,11 @@ ValidatedUsername = Annotated[
 PASSWORD_POLICY_VERSION = "1.1.0"
 """Текущая версия парольной политики (стратегии валиации паролей)."""
 
+_UPPERCASE_RE = re.compile(r"[A-Z]")
+_LOWERCASE_RE = re.compile(r"[a-z]")
+_DIGIT_RE = re.compile(r"[0-9]")
+_SPECIAL_CHAR_RE = re.compile(SPECIAL_CHAR_PATTERN)
+
 PASSWORD_RULES = [
     PasswordRuleSpec(
         id="min_length",
@@ -56,28 +68,28 @@ PASSWORD_RULES = [
         description="Password must contain at least one uppercase letter.",
         type=PasswordRuleType.BOOLEAN,
         value=True,
-        check=lambda v: bool(re.search(r"[A-Z]", v)),
+        check=lambda v: bool(_UPPERCASE_RE.search(v)),
     ),
     PasswordRuleSpec(
         id="require_lowercase",
         description="Password must contain at least one lowercase letter.",
         type=PasswordRuleType.BOOLEAN,
         value=True,
-        check=lambda v: bool(re.search(r"[a-z]", v)),
+        check=lambda v: bool(_LOWERCASE_RE.search(v)),
     ),
     PasswordRuleSpec(
         id="require_digit",
         description="Password must contain at least one digit.",
         type=PasswordRuleType.BOOLEAN,
         value=True,
-        check=lambda v: bool(re.search(r"[0-9]", v)),
+        check=lambda v: bool(_DIGIT_RE.search(v)),
     ),
     PasswordRuleSpec(
         id="require_special_character",
         description="Password must contain at least one special character.",
         type=PasswordRuleType.BOOLEAN,
         value=True,
-        check=lambda v: bool(re.search(SPECIAL_CHAR_PATTERN, v)),
+        check=lambda v: bool(_SPECIAL_CHAR_RE.search(v)),
     ),
     PasswordRuleSpec(
         id="special_character_set",
@@ -192,3 +204,56 @@ ValidatedDisplayName = Annotated[
 Используется в Pydantic-схемах для автоматической проверки и нормализации
 отображаемого имени пользователя при десериализации данных.
 """
+
+
+ValidatedTitle = Annotated[
+    str, StringConstraints(min_length=1, max_length=TITLE_MAX_LENGTH)
+]
+"""Типизированная аннотация для наименования альбома, файла или заметки.
+
+Ограничивает длину размером столбца `title`, чтобы слишком длинное
+наименование отклонялось при валидации, а не ошибкой базы данных.
+"""
+
+_HTTP_URL_ADAPTER = TypeAdapter(HttpUrl)
+"""Валидатор http(s)-ссылок на базе Rust-парсера URL из pydantic-core."""
+
+
+def validate_http_url(value: str) -> str:
+    """Проверяет, что строка является корректной http(s)-ссылкой.
+
+    Parameters
+    ----------
+    value : str
+        Ссылка в виде строки для проверки.
+
+    Returns
+    -------
+    str
+        Нормализованная ссылка в виде строки.
+
+    Raises
+    ------
+    pydantic_core.ValidationError
+        Если строка не является URL со схемой http или https.
+    ValueError
+        Если нормализованная ссылка длиннее `URL_MAX_LENGTH` символов.
+    """
+    # percent-encoding и punycode удлиняют ссылку, поэтому длина
+    # проверяется после нормализации - именно эта строка попадает в БД
+    normalized = str(_HTTP_URL_ADAPTER.validate_python(value))
+
+    if len(normalized) > URL_MAX_LENGTH:
+        raise ValueError(
+            f"URL should have at most {URL_MAX_LENGTH} characters after normalization"
+        )
+
+    return normalized
+
+
+ValidatedHttpUrl = Annotated[str, AfterValidator(validate_http_url)]
+"""Типизированная аннотация для поля с внешней http(s)-ссылкой.
+
+Структура ссылки проверяется при десериализации, но значение остаётся
+строкой, поэтому DTO и столбцы таблиц работают с `str` как и прежде.
+"""
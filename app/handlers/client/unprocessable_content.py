@@ -32,8 +32,9 @@ async def request_validation_error_handler(
     JSONResponse
         Ответ с ошибкой 422, кодом VALIDATION_ERROR.
     """
+    # ошибки уже собраны pydantic-core - повторная валидация не нужна
     return JSONResponse(
-        content=ValidationErrorResponse(
+        content=ValidationErrorResponse.model_construct(
             code=APICode.VALIDATION_ERROR,
             detail=jsonable_encoder(exc.errors()),
         ).model_dump(mode="json"),
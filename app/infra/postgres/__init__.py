@@ -1,17 +1,21 @@
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import create_async_engine
 
 from app.config import get_settings
 
+_settings = get_settings()
+
 async_engine = create_async_engine(
-    url=get_settings().POSTGRES_DSN.unicode_string(),
-    echo=False,
-    pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=10,
+    url=_settings.POSTGRES_DSN.unicode_string(),
+    echo=_settings.POSTGRES_ECHO,
+    pool_pre_ping=_settings.POSTGRES_POOL_PRE_PING,
+    pool_size=_settings.POSTGRES_POOL_SIZE,
+    max_overflow=_settings.POSTGRES_MAX_OVERFLOW,
+    pool_timeout=_settings.POSTGRES_POOL_TIMEOUT,
+    pool_recycle=_settings.POSTGRES_POOL_RECYCLE,
+    connect_args={
+        "prepared_statement_cache_size": _settings.POSTGRES_STATEMENT_CACHE_SIZE,
+        # точечные OLTP-запросы не окупают JIT-компиляцию
+        "server_settings": {"jit": "off"},
+    },
 )
 """SQLAlchemy async engine, который используется в этом проекте."""
-
-AsyncSessionMaker = async_sessionmaker(
-    bind=async_engine, class_=AsyncSession, expire_on_commit=False
-)
-"""Фабрика асинхронных сессий SQLAlchemy."""
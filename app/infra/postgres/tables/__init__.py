@@ -2,7 +2,7 @@ import importlib
 import pkgutil
 from datetime import datetime
 from pathlib import Path
-from uuid import UUID
+from uuid import UUID, uuid7
 
 from sqlalchemy import Column, ForeignKey, MetaData, Table, text
 from sqlalchemy.types import DateTime, Uuid
@@ -23,20 +23,30 @@ Notes
 """
 
 
-def base_columns() -> tuple[Column[UUID], Column[datetime]]:
+def base_columns(
+    *, time_ordered_id: bool = False
+) -> tuple[Column[UUID], Column[datetime]]:
     """Создать базовые колонки, общие для всех таблиц приложения.
 
     Каждый вызов возвращает новые объекты `Column`, что необходимо,
     так как SQLAlchemy привязывает колонку к конкретной таблице
     при её первом использовании.
 
+    Parameters
+    ----------
+    time_ordered_id : bool, optional
+        Генерировать ли `id` на стороне приложения как UUIDv7.
+        Упорядоченные по времени ключи дописываются в правый край
+        B-tree индекса вместо случайных вставок. По умолчанию False.
+
     Returns
     -------
     tuple[Column[UUID], Column[datetime]]
         Кортеж из двух колонок:
 
         - **id** : `UUID`, primary key.
-            Генерируется на стороне БД через `gen_random_uuid()`.
+            Генерируется через `uuid7()` при `time_ordered_id=True`,
+            иначе - на стороне БД через `gen_random_uuid()`.
         - **created_at** : `datetime` (timezone-aware), not null.
             Устанавливается на стороне БД в момент вставки строки
             через `TIMEZONE('UTC', NOW())`.
@@ -46,6 +56,7 @@ def base_columns() -> tuple[Column[UUID], Column[datetime]]:
             "id",
             Uuid(as_uuid=True),
             primary_key=True,
+            default=uuid7 if time_ordered_id else None,
             server_default=text("gen_random_uuid()"),
             comment="Уникальный идентификатор записи",
         ),
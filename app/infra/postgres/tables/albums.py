@@ -1,6 +1,7 @@
 from sqlalchemy import Column, Index, Table
 from sqlalchemy.types import Boolean, String, Text
 
+from app.core.consts import TITLE_MAX_LENGTH, URL_MAX_LENGTH
 from app.infra.postgres.tables import base_columns, metadata, owned_columns
 
 albums_table = Table(
@@ -9,7 +10,7 @@ albums_table = Table(
     *base_columns(),
     Column(
         "title",
-        String(64),
+        String(TITLE_MAX_LENGTH),
         default="Новый альбом",
         nullable=False,
         comment="Наименование альбома",
@@ -22,7 +23,7 @@ albums_table = Table(
     ),
     Column(
         "cover_url",
-        String(512),
+        String(URL_MAX_LENGTH),
         nullable=True,
         comment="URL обложки альбома",
     ),
@@ -2,6 +2,7 @@ from sqlalchemy import Column, Table
 from sqlalchemy.types import JSON, String, Text
 from sqlalchemy.types import Enum as SAEnum
 
+from app.core.consts import TITLE_MAX_LENGTH
 from app.core.enums import FileStatus
 from app.infra.postgres.tables import base_columns, metadata, owned_columns
 
@@ -35,7 +36,7 @@ files_table = Table(
     ),
     Column(
         "title",
-        String(64),
+        String(TITLE_MAX_LENGTH),
         default="Новый файл",
         nullable=False,
         comment="Наименование медиафайла",
@@ -2,6 +2,7 @@ from sqlalchemy import Column, Table
 from sqlalchemy.types import Enum as SAEnum
 from sqlalchemy.types import String, Text
 
+from app.core.consts import TITLE_MAX_LENGTH
 from app.core.enums import NoteType
 from app.infra.postgres.tables import base_columns, metadata, owned_columns
 
@@ -22,7 +23,7 @@ notes_table = Table(
     ),
     Column(
         "title",
-        String(64),
+        String(TITLE_MAX_LENGTH),
         default="Новая заметка",
         nullable=False,
         comment="Заголовок пользовательской заметки",
@@ -1,25 +1,27 @@
 from sqlalchemy import Column, ForeignKey, Table
-from sqlalchemy.types import DateTime, String, Uuid
+from sqlalchemy.types import DateTime, LargeBinary, Uuid
 
 from app.infra.postgres.tables import base_columns, metadata
 
 user_sessions_table = Table(
     "user_sessions",
     metadata,
-    *base_columns(),
+    *base_columns(time_ordered_id=True),
     Column(
         "user_id",
         Uuid(as_uuid=True),
         ForeignKey("users.id", ondelete="CASCADE"),
         nullable=False,
+        index=True,
         comment="Уникальный идентификатор пользователя",
     ),
     Column(
         "refresh_token_hash",
-        String(128),
+        LargeBinary(32),
         nullable=False,
+        unique=True,
         index=True,
-        comment="Хэш токена обновления (HMAC-SHA256)",
+        comment="Хэш токена обновления (HMAC-SHA256, сырой дайджест)",
     ),
     Column(
         "expires_at",
@@ -1,13 +1,17 @@
 from sqlalchemy import Column, Index, Table, UniqueConstraint, text
 from sqlalchemy.types import Boolean, String
 
-from app.core.consts import DISPLAY_NAME_MAX_LENGTH, USERNAME_MAX_LENGTH
+from app.core.consts import (
+    DISPLAY_NAME_MAX_LENGTH,
+    URL_MAX_LENGTH,
+    USERNAME_MAX_LENGTH,
+)
 from app.infra.postgres.tables import base_columns, metadata
 
 users_table = Table(
     "users",
     metadata,
-    *base_columns(),
+    *base_columns(time_ordered_id=True),
     Column(
         "username",
         String(USERNAME_MAX_LENGTH),
@@ -28,7 +32,7 @@ users_table = Table(
     ),
     Column(
         "avatar_url",
-        String(512),
+        String(URL_MAX_LENGTH),
         nullable=True,
         comment="URL аватара пользователя",
     ),
@@ -40,7 +44,6 @@ users_table = Table(
         comment="Статус пользователя (активный или заблокирован)",
     ),
     UniqueConstraint("username", name="uq_users_username"),
-    Index("ix_users_username", "username"),
     Index("ix_users_is_active", "is_active"),
     comment="Аутентифицированные пользователи системы",
 )
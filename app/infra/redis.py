@@ -45,6 +45,10 @@ class RedisClient:
         Инкрементирует счётчик записей пользователя.
     decrement_count(scope, user_id)
         Декрементирует счётчик записей пользователя.
+    get_partner_id(user_id)
+        Возвращает закэшированный UUID партнёра пользователя.
+    set_partner_id(user_id, partner_id, ttl)
+        Сохраняет UUID партнёра пользователя в кэше.
     acquire_idempotency_key(scope, user_id, key, ttl)
         Атомарно захватывает ключ идемпотентности.
     get_idempotency_state(scope, user_id, key)
@@ -309,6 +313,56 @@ class RedisClient:
         if await self.client.exists(redis_key):
             await self.client.decrby(redis_key, amount)
 
+    @staticmethod
+    def _partner_key(user_id: UUID) -> str:
+        """Вспомогательный "приватный" метод формирования Redis-ключа партнёра.
+
+        Parameters
+        ----------
+        user_id : UUID
+            UUID пользователя, для которого кэшируется партнёр.
+
+        Returns
+        -------
+        str
+            Redis-ключ вида: "partner:{user_id}".
+        """
+        return f"partner:{user_id}"
+
+    async def get_partner_id(self, user_id: UUID) -> UUID | None:
+        """Получение UUID партнёра пользователя из кэша.
+
+        Кэшируются только найденные партнёры: отсутствие пары не кэшируется,
+        поэтому None всегда означает cache miss.
+
+        Parameters
+        ----------
+        user_id : UUID
+            UUID пользователя.
+
+        Returns
+        -------
+        UUID | None
+            UUID партнёра или None при cache miss.
+        """
+        value = await self.client.get(self._partner_key(user_id))
+
+        return UUID(value) if value is not None else None
+
+    async def set_partner_id(self, user_id: UUID, partner_id: UUID, ttl: int) -> None:
+        """Сохраняет UUID партнёра пользователя в кэше.
+
+        Parameters
+        ----------
+        user_id : UUID
+            UUID пользователя.
+        partner_id : UUID
+            UUID партнёра пользователя.
+        ttl : int
+            Время жизни ключа в секундах.
+        """
+        await self.client.setex(self._partner_key(user_id), ttl, str(partner_id))
+
     @staticmethod
     def _idempotency_key(scope: str, user_id: UUID, key: UUID) -> str:
         """Вспомогательный "приватный" метод формирования Redis-ключа.
@@ -365,8 +419,10 @@ class RedisClient:
         )
 
         if created:
-            await self.client.hset(redis_key, "response", "")  # type: ignore
-            await self.client.expire(redis_key, ttl)
+            async with self.client.pipeline(transaction=True) as pipe:
+                pipe.hset(redis_key, "response", "")  # type: ignore
+                pipe.expire(redis_key, ttl)
+                await pipe.execute()
 
         return created == 1
 
@@ -429,14 +485,17 @@ class RedisClient:
         if response is None:
             response = ""
 
-        await self.client.hset(  # type: ignore
-            redis_key,
-            mapping={
-                "status": IdempotencyStatus.DONE,
-                "response": response,
-            },
-        )
-        await self.client.expire(redis_key, ttl)
+        # запись и продление TTL уходят одним MULTI/EXEC за один round-trip
+        async with self.client.pipeline(transaction=True) as pipe:
+            pipe.hset(  # type: ignore
+                redis_key,
+                mapping={
+                    "status": IdempotencyStatus.DONE,
+                    "response": response,
+                },
+            )
+            pipe.expire(redis_key, ttl)
+            await pipe.execute()
 
 
 redis_client = RedisClient(
@@ -1,4 +1,6 @@
+from functools import cache
 from typing import Any, Sequence
+from uuid import UUID
 
 from sqlalchemy import (
     ColumnElement,
@@ -33,6 +35,7 @@ from app.schemas.dto.couple import (
 
 first_users_table = users_table.alias("first_users")
 second_users_table = users_table.alias("second_users")
+partners_table = couple_members_table.alias("partners")
 
 
 class CoupleRepository(
@@ -55,6 +58,8 @@ class CoupleRepository(
         Возвращает пару с блокировкой строки для последующего изменения.
     update_one(filter_dto, update_dto, access_ctx)
         Обновляет пару по фильтрам.
+    read_partner_id(user_id)
+        Возвращает UUID партнёра пользователя.
     """
 
     async def create_one(self, create_dto: CreateCoupleDTO) -> bool:
@@ -131,26 +136,9 @@ class CoupleRepository(
         )
 
     @classmethod
-    def _build_read_statement(cls, *where_clauses: ColumnElement[bool]) -> Select[Any]:
-        """Строит SELECT-запрос для чтения пары с обоими участниками.
-
-        Выполняет двойной self-join `couple_members` (алиасы `m1` и `m2`)
-        для раздельного получения первого и второго участников по слотам,
-        после чего присоединяет `users` для каждого из них.
-
-        Используется в `read_one` и `read_one_for_update` во избежание
-        дублирования логики построения запроса.
-
-        Parameters
-        ----------
-        *where_clauses : ColumnElement[bool]
-            WHERE-условия, как правило полученные из `_filter_one_to_clauses`.
-
-        Returns
-        -------
-        Select[Any]
-            Готовый SELECT-запрос без исполнения.
-        """
+    @cache
+    def _base_read_statement(cls) -> Select[Any]:
+        """Возвращает закэшированный SELECT-запрос пары без WHERE-условий."""
         return (
             select(
                 couples_table,
@@ -176,9 +164,30 @@ class CoupleRepository(
                 (m2.c.couple_id == couples_table.c.id) & (m2.c.slot == 2),
             )
             .join(second_users_table, second_users_table.c.id == m2.c.user_id)
-            .where(*where_clauses)
         )
 
+    @classmethod
+    def _build_read_statement(cls, *where_clauses: ColumnElement[bool]) -> Select[Any]:
+        """Строит SELECT-запрос для чтения пары с обоими участниками.
+
+        Добавляет WHERE-условия к закэшированному запросу
+        из `_base_read_statement`.
+
+        Используется в `read_one` и `read_one_for_update` во избежание
+        дублирования логики построения запроса.
+
+        Parameters
+        ----------
+        *where_clauses : ColumnElement[bool]
+            WHERE-условия, как правило полученные из `_filter_one_to_clauses`.
+
+        Returns
+        -------
+        Select[Any]
+            Готовый SELECT-запрос без исполнения.
+        """
+        return cls._base_read_statement().where(*where_clauses)
+
     async def read_one(
         self, filter_dto: FilterOneCoupleDTO, access_ctx: AccessContext
     ) -> CoupleDTO | None:
@@ -337,3 +346,34 @@ class CoupleRepository(
         raise NotImplementedError(
             "Method 'update_many' is not implemented in CoupleRepository"
         )
+
+    async def read_partner_id(self, user_id: UUID) -> UUID | None:
+        """Возвращает UUID партнёра пользователя.
+
+        Облегчённая альтернатива `read_one` для случаев, когда нужен
+        только идентификатор партнёра: выполняет один self-join
+        `couple_members` по индексам `uq_one_couple_per_user` и
+        `uq_couple_slot`, не присоединяя `couples` и `users`.
+
+        Parameters
+        ----------
+        user_id : UUID
+            UUID пользователя.
+
+        Returns
+        -------
+        UUID | None
+            UUID партнёра или None, если пользователь не состоит в паре.
+        """
+        result = await self.connection.execute(
+            select(partners_table.c.user_id)
+            .select_from(couple_members_table)
+            .join(
+                partners_table,
+                (partners_table.c.couple_id == couple_members_table.c.couple_id)
+                & (partners_table.c.user_id != couple_members_table.c.user_id),
+            )
+            .where(couple_members_table.c.user_id == user_id)
+        )
+
+        return result.scalar_one_or_none()
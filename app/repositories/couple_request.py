@@ -1,5 +1,6 @@
 from typing import Any, Sequence
 
+from pydantic import TypeAdapter
 from sqlalchemy import (
     ColumnElement,
     Select,
@@ -35,6 +36,9 @@ from app.schemas.dto.couple import (
 initiators_table = users_table.alias("initiators")
 recipients_table = users_table.alias("recipients")
 
+_COUPLE_REQUESTS_ADAPTER = TypeAdapter(list[CoupleRequestDTO])
+"""Валидатор страницы запросов на создание пары."""
+
 
 class CoupleRequestRepository(
     Creator[CreateCoupleRequestDTO],
@@ -255,11 +259,12 @@ class CoupleRequestRepository(
             .order_by(
                 self._build_order_clause(couple_requests_table.c.created_at, sort_order)
             )
-            .slice(offset, offset + limit)
+            .offset(offset)
+            .limit(limit)
         )
 
-        return [
-            CoupleRequestDTO.model_validate(
+        return _COUPLE_REQUESTS_ADAPTER.validate_python(
+            [
                 {
                     **row,
                     "initiator": self._extract_prefixed(
@@ -269,9 +274,9 @@ class CoupleRequestRepository(
                         row, "recipient", USER_PROJECTION_FIELDS
                     ),
                 }
-            )
-            for row in result.mappings().all()
-        ]
+                for row in result.mappings()
+            ]
+        )
 
     async def update_one(
         self,
@@ -11,10 +11,13 @@ from sqlalchemy import (
     RowMapping,
     Select,
     Table,
+    any_,
+    bindparam,
     func,
     select,
     true,
 )
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.asyncio import AsyncConnection
 from sqlalchemy.sql.elements import ColumnElement, UnaryExpression
 
@@ -235,10 +238,14 @@ class CoupleAccessContext(AccessContext):
         """
         col = self._require_col(table, "created_by")
 
+        # единая форма `created_by = ANY($1::uuid[])` независимо от наличия
+        # партнёра: текст SQL не меняется, и драйвер переиспользует
+        # подготовленный (prepared) запрос
+        ids = [self.user_id]
         if self.partner_id is not None:
-            return col.in_([self.user_id, self.partner_id])
+            ids.append(self.partner_id)
 
-        return col == self.user_id
+        return col == any_(bindparam(None, ids, type_=ARRAY(col.type)))
 
 
 class RepositoryInterface(ABC):
@@ -252,6 +259,20 @@ class RepositoryInterface(ABC):
     ----------
     connection : AsyncConnection
         Объект асинхронного подключения запроса.
+
+    Notes
+    -----
+    Одно `AsyncConnection` не допускает конкурентных операций: запросы
+    через него должны выполняться строго последовательно. Вызов нескольких
+    методов репозитория через `asyncio.gather(...)` не даёт параллелизма
+    и приводит к ошибке драйвера `another operation is in progress`.
+
+    Базовый SELECT, не зависящий от аргументов (`_base_read_statement`),
+    объявляется как `@classmethod` поверх `@cache` и собирается один раз
+    на процесс: `Select` иммутабелен, а `.where()` возвращает новую копию,
+    поэтому закэшированный объект не изменяется. Страницы `read_many`
+    валидируются модульным `TypeAdapter(list[DTO])` одним вызовом на весь
+    список строк; его схема строится один раз при импорте.
     """
 
     def __init__(self, connection: AsyncConnection) -> None:
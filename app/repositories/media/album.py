@@ -1,7 +1,7 @@
-import asyncio
 from typing import Any, Sequence
 from uuid import UUID
 
+from pydantic import TypeAdapter
 from sqlalchemy import (
     ColumnElement,
     Select,
@@ -45,6 +45,9 @@ from app.schemas.dto.album import (
     UpdateAlbumDTO,
 )
 
+_ALBUMS_ADAPTER = TypeAdapter(list[AlbumDTO])
+"""Валидатор страницы альбомов."""
+
 
 class AlbumRepository(
     Creator[CreateAlbumDTO],
@@ -259,20 +262,21 @@ class AlbumRepository(
                 access_ctx.as_where_clause(albums_table),
             )
             .order_by(self._build_order_clause(albums_table.c.created_at, sort_order))
-            .slice(offset, offset + limit)
+            .offset(offset)
+            .limit(limit)
         )
 
-        return [
-            AlbumDTO.model_validate(
+        return _ALBUMS_ADAPTER.validate_python(
+            [
                 {
                     **row,
                     "creator": self._extract_prefixed(
                         row, "creator", USER_PROJECTION_FIELDS
                     ),
                 }
-            )
-            for row in result.mappings().all()
-        ]
+                for row in result.mappings()
+            ]
+        )
 
     async def update_one(
         self,
@@ -476,46 +480,44 @@ class AlbumRepository(
             ),
         ]
 
-        result, total = await asyncio.gather(
-            self.connection.execute(
-                self._build_read_statement(*where_clauses)
-                .order_by(
-                    # полные вхождения в списке идут выше
-                    case((or_(*ilikes), 1.0), else_=0.0).desc(),
-                    func.greatest(
-                        func.coalesce(
-                            func.similarity(
-                                albums_table.c.title, search_dto.search_query
-                            ),
-                            0.0,
-                        ),
-                        func.coalesce(
-                            func.similarity(
-                                albums_table.c.description, search_dto.search_query
-                            ),
-                            0.0,
+        result = await self.connection.execute(
+            self._build_read_statement(*where_clauses)
+            .order_by(
+                # полные вхождения в списке идут выше
+                case((or_(*ilikes), 1.0), else_=0.0).desc(),
+                func.greatest(
+                    func.coalesce(
+                        func.similarity(albums_table.c.title, search_dto.search_query),
+                        0.0,
+                    ),
+                    func.coalesce(
+                        func.similarity(
+                            albums_table.c.description, search_dto.search_query
                         ),
-                    ).desc(),
-                    albums_table.c.created_at,
-                )
-                .slice(offset, offset + limit)
-            ),
-            self.connection.scalar(
-                self._build_count_query(albums_table, *where_clauses)
-            ),
+                        0.0,
+                    ),
+                ).desc(),
+                albums_table.c.created_at,
+            )
+            .offset(offset)
+            .limit(limit)
         )
 
-        return [
-            AlbumDTO.model_validate(
+        total = await self.connection.scalar(
+            self._build_count_query(albums_table, *where_clauses)
+        )
+
+        return _ALBUMS_ADAPTER.validate_python(
+            [
                 {
                     **row,
                     "creator": self._extract_prefixed(
                         row, "creator", USER_PROJECTION_FIELDS
                     ),
                 }
-            )
-            for row in result.mappings().all()
-        ], total or 0
+                for row in result.mappings()
+            ]
+        ), total or 0
 
     async def get_with_items(
         self,
@@ -527,10 +529,12 @@ class AlbumRepository(
     ) -> InternalAlbumWithItemsDTO | None:
         """Получает DTO альбома с постраничным списком медиафайлов.
 
-        Параллельно выполняет три запроса: получение альбома с создателем,
-        постраничную выборку медиафайлов и подсчёт их общего количества.
+        Последовательно выполняет до трёх запросов: получение альбома с создателем,
+        постраничную выборку медиафайлов с их создателями и подсчёт общего
+        количества. Подсчёт пропускается, если страница неполная.
         Файлы фильтруются по тому же контексту доступа, что и альбом.
-        Если альбом не найден или недоступен - возвращает None.
+        Если альбом не найден или недоступен - возвращает None, не выполняя
+        запросы за медиафайлами.
 
         Parameters
         ----------
@@ -548,47 +552,49 @@ class AlbumRepository(
         InternalAlbumWithItemsDTO | None
             DTO альбома с медиафайлами, или None если альбом не найден.
         """
-        album_result, items_result, total = await asyncio.gather(
-            # альбом с данными создателя
-            self.connection.execute(
-                self._build_read_statement(
-                    *self._build_filter_clauses(filter_dto, albums_table),
-                    access_ctx.as_where_clause(albums_table),
-                )
-            ),
-            # постраничная выборка файлов альбома с данными их создателей
-            self.connection.execute(
-                select(
-                    files_table,
-                    *self._label_columns(
-                        users_table, USER_PROJECTION_FIELDS, "creator"
-                    ),
-                )
-                .join(users_table, users_table.c.id == files_table.c.created_by)
-                .join(
-                    album_items_table, album_items_table.c.file_id == files_table.c.id
-                )
-                .where(
-                    items_where_clause := and_(
-                        album_items_table.c.album_id == filter_dto.id,
-                        access_ctx.as_where_clause(files_table),
-                    )
-                )
-                .slice(offset, offset + limit)
-            ),
-            # общее количество доступных файлов (без учёта пагинации)
-            self.connection.scalar(
+        # альбом с данными создателя
+        album_result = await self.connection.execute(
+            self._build_read_statement(
+                *self._build_filter_clauses(filter_dto, albums_table),
+                access_ctx.as_where_clause(albums_table),
+            )
+        )
+
+        if not (album_row := album_result.mappings().first()):
+            return None
+
+        items_where_clause = and_(
+            album_items_table.c.album_id == filter_dto.id,
+            access_ctx.as_where_clause(files_table),
+        )
+
+        # постраничная выборка файлов альбома с данными их создателей
+        items_result = await self.connection.execute(
+            select(
+                files_table,
+                *self._label_columns(users_table, USER_PROJECTION_FIELDS, "creator"),
+            )
+            .join(users_table, users_table.c.id == files_table.c.created_by)
+            .join(album_items_table, album_items_table.c.file_id == files_table.c.id)
+            .where(items_where_clause)
+            .offset(offset)
+            .limit(limit)
+        )
+
+        item_rows = items_result.mappings().all()
+
+        # неполная страница уже даёт общее количество - подсчёт не нужен
+        if len(item_rows) < limit and (item_rows or offset == 0):
+            total = offset + len(item_rows)
+        else:
+            total = await self.connection.scalar(
                 self._build_count_query(
                     album_items_table.join(
                         files_table, files_table.c.id == album_items_table.c.file_id
                     ),
                     items_where_clause,
                 )
-            ),
-        )
-
-        if not (album_row := album_result.mappings().first()):
-            return None
+            )
 
         return InternalAlbumWithItemsDTO.model_validate(
             {
@@ -603,7 +609,7 @@ class AlbumRepository(
                             item_row, "creator", USER_PROJECTION_FIELDS
                         ),
                     }
-                    for item_row in items_result.mappings().all()
+                    for item_row in item_rows
                 ],
                 "total": total or 0,
             }
@@ -1,5 +1,6 @@
 from typing import Any, Sequence
 
+from pydantic import TypeAdapter
 from sqlalchemy import ColumnElement, Select, delete, insert, select, update
 
 from app.core.consts import DEFAULT_LIMIT, DEFAULT_OFFSET
@@ -23,6 +24,9 @@ from app.schemas.dto.file import (
     UpdateFileDTO,
 )
 
+_FILES_ADAPTER = TypeAdapter(list[InternalFileDTO])
+"""Валидатор страницы медиафайлов."""
+
 
 class FileRepository(
     Creator[CreateFileDTO],
@@ -242,20 +246,21 @@ class FileRepository(
                 access_ctx.as_where_clause(files_table),
             )
             .order_by(self._build_order_clause(files_table.c.created_at, sort_order))
-            .slice(offset, offset + limit)
+            .offset(offset)
+            .limit(limit)
         )
 
-        return [
-            InternalFileDTO.model_validate(
+        return _FILES_ADAPTER.validate_python(
+            [
                 {
                     **row,
                     "creator": self._extract_prefixed(
                         row, "creator", USER_PROJECTION_FIELDS
                     ),
                 }
-            )
-            for row in result.mappings().all()
-        ]
+                for row in result.mappings()
+            ]
+        )
 
     async def update_one(
         self,
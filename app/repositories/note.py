@@ -1,5 +1,8 @@
+from functools import cache
 from typing import Any, Sequence
+from uuid import UUID
 
+from pydantic import TypeAdapter
 from sqlalchemy import ColumnElement, Select, delete, insert, select, update
 
 from app.core.consts import DEFAULT_LIMIT, DEFAULT_OFFSET
@@ -23,6 +26,9 @@ from app.schemas.dto.note import (
     UpdateNoteDTO,
 )
 
+_NOTES_ADAPTER = TypeAdapter(list[NoteDTO])
+"""Валидатор страницы заметок."""
+
 
 class NoteRepository(
     Creator[CreateNoteDTO],
@@ -55,6 +61,10 @@ class NoteRepository(
         Обновление атрибутов заметки в базе данных.
     delete_one(filter_dto, access_ctx)
         Удаляет запись о пользовательской заметке из базы данных.
+    delete_many(filter_dto, access_ctx)
+        Удаляет множество записей о пользовательских заметках из базы данных.
+    delete_many_returning_ids(filter_dto, access_ctx)
+        Удаляет множество заметок и возвращает UUID удалённых записей.
     count(filter_dto, access_ctx)
         Возвращает количество заметок по фильтру и контексту доступа.
     """
@@ -88,12 +98,21 @@ class NoteRepository(
             "Method 'create_many' is not implemented in NoteRepository"
         )
 
+    @classmethod
+    @cache
+    def _base_read_statement(cls) -> Select[Any]:
+        """Возвращает закэшированный SELECT-запрос заметки без WHERE-условий."""
+        return select(
+            notes_table,
+            *cls._label_columns(users_table, USER_PROJECTION_FIELDS, "creator"),
+        ).join(users_table, users_table.c.id == notes_table.c.created_by)
+
     @classmethod
     def _build_read_statement(cls, *where_clauses: ColumnElement[bool]) -> Select[Any]:
         """Строит SELECT-запрос для чтения заметки.
 
-        Принимает готовые WHERE-условия и выполняет JOIN `users_table`
-        для получения DTO создателя.
+        Добавляет готовые WHERE-условия к закэшированному запросу
+        из `_base_read_statement`.
 
         Используется в `read_one`, `read_one_for_update` и `read_many`
         во избежание дублирования логики построения запроса.
@@ -108,14 +127,7 @@ class NoteRepository(
         Select[Any]
             Готовый SELECT-запрос без исполнения.
         """
-        return (
-            select(
-                notes_table,
-                *cls._label_columns(users_table, USER_PROJECTION_FIELDS, "creator"),
-            )
-            .join(users_table, users_table.c.id == notes_table.c.created_by)
-            .where(*where_clauses)
-        )
+        return cls._base_read_statement().where(*where_clauses)
 
     async def read_one(
         self, filter_dto: FilterOneNoteDTO, access_ctx: AccessContext
@@ -232,20 +244,21 @@ class NoteRepository(
                 access_ctx.as_where_clause(notes_table),
             )
             .order_by(self._build_order_clause(notes_table.c.created_at, sort_order))
-            .slice(offset, offset + limit)
+            .offset(offset)
+            .limit(limit)
         )
 
-        return [
-            NoteDTO.model_validate(
+        return _NOTES_ADAPTER.validate_python(
+            [
                 {
                     **row,
                     "creator": self._extract_prefixed(
                         row, "creator", USER_PROJECTION_FIELDS
                     ),
                 }
-            )
-            for row in result.mappings().all()
-        ]
+                for row in result.mappings()
+            ]
+        )
 
     async def update_one(
         self,
@@ -351,6 +364,38 @@ class NoteRepository(
 
         return result.rowcount
 
+    async def delete_many_returning_ids(
+        self, filter_dto: FilterManyNotesDTO, access_ctx: AccessContext
+    ) -> list[UUID]:
+        """Удаляет множество заметок и возвращает UUID удалённых записей.
+
+        Выполняет `DELETE ... RETURNING id`, поэтому не требует
+        предварительного чтения заметок (вместе с их содержимым
+        и данными создателя) только ради проверки их существования.
+
+        Parameters
+        ----------
+        filter_dto : FilterManyNotesDTO
+            Параметры фильтрации.
+        access_ctx : AccessContext
+            Контекст доступа.
+
+        Returns
+        -------
+        list[UUID]
+            Список UUID успешно удалённых заметок.
+        """
+        result = await self.connection.execute(
+            delete(notes_table)
+            .where(
+                *self._build_filter_clauses(filter_dto, notes_table),
+                access_ctx.as_where_clause(notes_table),
+            )
+            .returning(notes_table.c.id)
+        )
+
+        return list(result.scalars().all())
+
     async def count(
         self, filter_dto: FilterManyNotesDTO, access_ctx: AccessContext
     ) -> int:
@@ -1,7 +1,7 @@
 from typing import Any, Sequence
 
-from sqlalchemy import insert, select, update
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy import select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from app.core.consts import DEFAULT_LIMIT, DEFAULT_OFFSET
 from app.core.enums import SortOrder
@@ -66,17 +66,17 @@ class UserRepository(
         UsernameAlreadyExistsException
            Пользователь с переданным username уже существует.
         """
-        try:
-            result = await self.connection.execute(
-                insert(users_table).values(**create_dto.to_create_values())
-            )
-        except IntegrityError as e:
-            if "uq_users_username" in str(e):
-                raise UsernameAlreadyExistsException(
-                    detail=f"User with username={create_dto.username} already exists."
-                ) from e
+        # конфликт по username не прерывает транзакцию: строка просто не вставляется
+        result = await self.connection.execute(
+            pg_insert(users_table)
+            .values(**create_dto.to_create_values())
+            .on_conflict_do_nothing(constraint="uq_users_username")
+        )
 
-            raise
+        if result.rowcount == 0:
+            raise UsernameAlreadyExistsException(
+                detail=f"User with username={create_dto.username} already exists."
+            )
 
         return result.rowcount == 1
 
@@ -118,7 +118,7 @@ class UserRepository(
         if not (row := result.mappings().first()):
             return None
 
-        return UserWithCredentialsDTO.model_validate(row)
+        return UserWithCredentialsDTO.from_row(row)
 
     async def read_one_for_update(
         self, filter_dto: FilterOneUserDTO, access_ctx: AccessContext
@@ -153,7 +153,7 @@ class UserRepository(
         if not (row := result.mappings().first()):
             return None
 
-        return UserWithCredentialsDTO.model_validate(row)
+        return UserWithCredentialsDTO.from_row(row)
 
     async def read_many(
         self,
@@ -99,7 +99,7 @@ class UserSessionRepository(
         if not (row := result.mappings().first()):
             return None
 
-        return UserSessionDTO.model_validate(row)
+        return UserSessionDTO.from_row(row)
 
     async def read_one_for_update(
         self, filter_dto: FilterOneUserSessionDTO, access_ctx: AccessContext
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Any, Self, Sequence
+from typing import Any, Mapping, Self, Sequence
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, model_validator
@@ -82,6 +82,31 @@ class BaseSQLCoreDTO(BaseDTO):
         from_attributes=True,
     )
 
+    @classmethod
+    def from_row(cls, row: Mapping[str, Any]) -> Self:
+        """Создаёт DTO из строки результата запроса без валидации.
+
+        Строка приходит из типизированных столбцов таблицы, поэтому
+        повторная проверка типов Pydantic здесь избыточна.
+
+        Parameters
+        ----------
+        row : Mapping[str, Any]
+            Строка результата (`RowMapping`) с именами столбцов в качестве ключей.
+
+        Returns
+        -------
+        Self
+            Экземпляр DTO, собранный через `model_construct`.
+
+        Notes
+        -----
+        Подходит только для плоских DTO: `model_construct` не преобразует
+        вложенные модели. DTO со вложенными объектами (например, `creator`)
+        по-прежнему строятся через валидацию.
+        """
+        return cls.model_construct(**row)
+
 
 class BaseFilterDTO(BaseDTO):
     """Базовый DTO для фильтрации записей.
@@ -2,7 +2,7 @@ from datetime import datetime
 from typing import Annotated
 from uuid import UUID
 
-from app.core.filtering import ColumnAlias
+from app.core.filtering import LTE, ColumnAlias
 from app.core.types import UNIQUE, UNSET, Maybe
 from app.schemas.dto.base import (
     BaseCreateDTO,
@@ -20,7 +20,7 @@ class UserSessionDTO(BaseSQLCoreDTO):
     ----------
     user_id : UUID
         UUID пользователя системы (владельца сессии).
-    refresh_token_hash : str
+    refresh_token_hash : bytes
         Хэш токена обновления сессии пользователя.
     expires_at : datetime
         Дата и время, когда токен будет просрочен.
@@ -29,7 +29,7 @@ class UserSessionDTO(BaseSQLCoreDTO):
     """
 
     user_id: UUID
-    refresh_token_hash: str
+    refresh_token_hash: bytes
     expires_at: datetime
     last_used_at: datetime
 
@@ -46,7 +46,7 @@ class FilterOneUserSessionDTO(BaseFilterOneDTO):
     id : Maybe[UUID]
         Идентификатор сессии. Является уникальным полем - достаточно передать только его
         для однозначного нахождения записи.
-    refresh_token_hash : Maybe[str]
+    refresh_token_hash : Maybe[bytes]
         Хэш рефреш-токена. Является уникальным полем - достаточно передать только его
         для однозначного нахождения записи.
     user_id : Maybe[UUID]
@@ -55,7 +55,7 @@ class FilterOneUserSessionDTO(BaseFilterOneDTO):
     """
 
     id: Annotated[Maybe[UUID], UNIQUE] = UNSET
-    refresh_token_hash: Annotated[Maybe[str], UNIQUE] = UNSET
+    refresh_token_hash: Annotated[Maybe[bytes], UNIQUE] = UNSET
 
     user_id: Maybe[UUID] = UNSET
 
@@ -72,15 +72,18 @@ class FilterManyUserSessionsDTO(BaseFilterManyDTO):
         Список идентификаторов сессий.
     user_ids : Maybe[list[UUID]]
         Список идентификаторов пользователей.
-    refresh_token_hashes : Maybe[list[str]]
+    refresh_token_hashes : Maybe[list[bytes]]
         Список хэшей рефреш-токенов.
+    expires_before : Maybe[datetime]
+        Верхняя граница срока действия - отбирает истёкшие сессии.
     """
 
     ids: Annotated[Maybe[list[UUID]], ColumnAlias("id")] = UNSET
     user_ids: Annotated[Maybe[list[UUID]], ColumnAlias("user_id")] = UNSET
     refresh_token_hashes: Annotated[
-        Maybe[list[str]], ColumnAlias("refresh_token_hash")
+        Maybe[list[bytes]], ColumnAlias("refresh_token_hash")
     ] = UNSET
+    expires_before: Annotated[Maybe[datetime], LTE, ColumnAlias("expires_at")] = UNSET
 
 
 class CreateUserSessionDTO(BaseCreateDTO):
@@ -92,7 +95,7 @@ class CreateUserSessionDTO(BaseCreateDTO):
         Идентификатор сессии.
     user_id : UUID
         UUID пользователя системы (владельца сессии).
-    refresh_token_hash : str
+    refresh_token_hash : bytes
         Хэш токена обновления сессии пользователя.
     expires_at : datetime
         Дата и время, когда токен будет просрочен.
@@ -102,7 +105,7 @@ class CreateUserSessionDTO(BaseCreateDTO):
 
     id: UUID
     user_id: UUID
-    refresh_token_hash: str
+    refresh_token_hash: bytes
     expires_at: datetime
     last_used_at: datetime | None
 
@@ -112,7 +115,7 @@ class UpdateUserSessionDTO(BaseUpdateDTO):
 
     Attributes
     ----------
-    refresh_token_hash : Maybe[str]
+    refresh_token_hash : Maybe[bytes]
         Новый хэш токена обновления сессии пользователя.
         Если `UNSET` - поле не изменяется.
     expires_at : Maybe[datetime]
@@ -123,6 +126,6 @@ class UpdateUserSessionDTO(BaseUpdateDTO):
         Если `UNSET` - поле не изменяется.
     """
 
-    refresh_token_hash: Maybe[str] = UNSET
+    refresh_token_hash: Maybe[bytes] = UNSET
     expires_at: Maybe[datetime] = UNSET
     last_used_at: Maybe[datetime] = UNSET
@@ -4,6 +4,7 @@ from pydantic import BaseModel, Field
 
 from app.core.consts import MAX_LIMIT
 from app.core.types import UNSET, Maybe
+from app.core.validation import ValidatedHttpUrl, ValidatedTitle
 
 
 class CreateAlbumRequest(BaseModel):
@@ -23,7 +24,7 @@ class CreateAlbumRequest(BaseModel):
         Видимость альбома (True - личный или False - публичный).
     """
 
-    title: str = Field(
+    title: ValidatedTitle = Field(
         default="Новый альбом",
         description="Наименование медиаальбома",
         examples=["Поездка в Париж 2004"],
@@ -33,12 +34,10 @@ class CreateAlbumRequest(BaseModel):
         description="Описание медиаальбома",
         examples=["Альбом с романтичными видами Города Любви!"],
     )
-    cover_url: str | None = Field(
+    cover_url: ValidatedHttpUrl | None = Field(
         default=None,
         description="Ссылка на обложку медиаальбома",
-        examples=[
-            "https://camo.githubusercontent.com/78a574a2925825ac33911b5a8bad6176bea158260c4581a72129bfa8d2ce87f3/68747470733a2f2f7777772e6963656769662e636f6d2f77702d636f6e74656e742f75706c6f6164732f323032332f30312f6963656769662d3136322e676966"
-        ],
+        examples=["https://example.com/covers/paris.jpg"],
     )
     is_private: bool = Field(
         default=False,
@@ -73,7 +72,7 @@ class PatchAlbumRequest(BaseModel):
         в базе данных не изменяется.
     """
 
-    title: Maybe[str] = Field(
+    title: Maybe[ValidatedTitle] = Field(
         default_factory=lambda: UNSET,
         description="Наименование медиаальбома",
         examples=["Поездка в Париж 2004"],
@@ -83,12 +82,10 @@ class PatchAlbumRequest(BaseModel):
         description="Описание медиаальбома",
         examples=["Альбом с романтичными видами Города Любви!"],
     )
-    cover_url: Maybe[str | None] = Field(
+    cover_url: Maybe[ValidatedHttpUrl | None] = Field(
         default_factory=lambda: UNSET,
         description="Ссылка на обложку медиаальбома",
-        examples=[
-            "https://camo.githubusercontent.com/78a574a2925825ac33911b5a8bad6176bea158260c4581a72129bfa8d2ce87f3/68747470733a2f2f7777772e6963656769662e636f6d2f77702d636f6e74656e742f75706c6f6164732f323032332f30312f6963656769662d3136322e676966"
-        ],
+        examples=["https://example.com/covers/paris.jpg"],
     )
     is_private: Maybe[bool] = Field(
         default_factory=lambda: UNSET,
@@ -130,6 +127,7 @@ class AttachFilesRequest(BaseModel):
     ----------
     files_uuids : list[UUID]
         Список UUID медиафайлов к добавлению.
+        Ограничения: минимум один UUID, максимум `MAX_LIMIT` UUID.
     """
 
     files_uuids: list[UUID] = Field(
@@ -140,4 +138,6 @@ class AttachFilesRequest(BaseModel):
                 "f466bb69-bf31-4125-a29a-35166033e4ef",
             ]
         ],
+        min_length=1,
+        max_length=MAX_LIMIT,
     )
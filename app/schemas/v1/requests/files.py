@@ -4,6 +4,7 @@ from pydantic import BaseModel, Field
 
 from app.core.consts import MAX_LIMIT
 from app.core.types import UNSET, Maybe
+from app.core.validation import ValidatedTitle
 
 
 class UploadFileRequest(BaseModel):
@@ -23,11 +24,12 @@ class UploadFileRequest(BaseModel):
         description="MIME-тип отправляемого файла.",
         examples=["image/png"],
     )
-    title: str = Field(
+    title: ValidatedTitle = Field(
         description="Наименование медиафайла.",
         examples=["яскотятами"],
     )
     description: str | None = Field(
+        default=None,
         description="Описание медиафайла.",
         examples=["Файл смерти: кто прочитал, тот..."],
     )
@@ -126,7 +128,7 @@ class PatchFileRequest(BaseModel):
         как None для удаления описания.
     """
 
-    title: Maybe[str] = Field(
+    title: Maybe[ValidatedTitle] = Field(
         default_factory=lambda: UNSET,
         description="Наименование медиафайла",
         examples=["яскотятами"],
@@ -5,6 +5,7 @@ from pydantic import BaseModel, Field
 from app.core.consts import MAX_LIMIT
 from app.core.enums import NoteType
 from app.core.types import UNSET, Maybe
+from app.core.validation import ValidatedTitle
 
 
 class CreateNoteRequest(BaseModel):
@@ -26,7 +27,7 @@ class CreateNoteRequest(BaseModel):
         description="Тип пользовательской заметки",
         examples=[NoteType.WISHLIST],
     )
-    title: str = Field(
+    title: ValidatedTitle = Field(
         default="Новая заметка",
         description="Заголовок пользовательской заметки",
         examples=["Новый телефон"],
@@ -54,7 +55,7 @@ class PatchNoteRequest(BaseModel):
         и текущее значение в базе данных не изменяется.
     """
 
-    title: Maybe[str] = Field(
+    title: Maybe[ValidatedTitle] = Field(
         default_factory=lambda: UNSET,
         description="Заголовок пользовательской заметки",
         examples=["Новый телефон"],
@@ -1,7 +1,7 @@
 from pydantic import BaseModel, Field
 
 from app.core.types import UNSET, Maybe
-from app.core.validation import ValidatedDisplayName
+from app.core.validation import ValidatedDisplayName, ValidatedHttpUrl
 
 
 class PatchProfileRequest(BaseModel):
@@ -26,7 +26,7 @@ class PatchProfileRequest(BaseModel):
         description="Новое отображаемое имя пользователя",
         examples=["Владислав", "88005553535", "الاسم", "👨⚒👨‍👧‍👦⏮🗿🦀🚀"],
     )
-    avatar_url: Maybe[str] = Field(
+    avatar_url: Maybe[ValidatedHttpUrl] = Field(
         default_factory=lambda: UNSET,
         description="URL аватара пользователя",
         examples=[
@@ -1,5 +1,6 @@
+from typing import Any
+
 from pydantic import Field
-from pydantic_core import ErrorDetails
 
 from app.core.enums import APICode
 from app.schemas.v1.responses.standard import BaseResponse
@@ -16,8 +17,9 @@ class ValidationErrorResponse(BaseResponse):
     ----------
     code : int
         HTTP-код ответа сервера.
-    detail : list[ErrorDetails]
-        Список ошибок валидации.
+    detail : list[dict[str, Any]]
+        Список ошибок валидации в формате `pydantic_core.ErrorDetails`,
+        уже приведённых к JSON-совместимому виду.
     """
 
     code: APICode = Field(
@@ -25,6 +27,6 @@ class ValidationErrorResponse(BaseResponse):
         description="Статус ответа от сервера в виде API Enum",
         examples=[APICode.VALIDATION_ERROR],
     )
-    detail: list[ErrorDetails] = Field(
+    detail: list[dict[str, Any]] = Field(
         description="Список ошибок валидации переданных данных.",
     )
@@ -1,7 +1,8 @@
 from datetime import datetime, timedelta, timezone
 from math import ceil
+from time import time
 from typing import Literal, overload
-from uuid import uuid4
+from uuid import uuid7
 
 from jose import ExpiredSignatureError, JWTError
 from pydantic import ValidationError
@@ -19,10 +20,10 @@ from app.core.exceptions.auth import (
 )
 from app.core.security import (
     create_jwt,
-    hash_,
+    hash_async,
     hash_token,
     jwt_decode,
-    verify,
+    verify_async,
 )
 from app.core.types import TokenType
 from app.infra.postgres.uow import UnitOfWork
@@ -71,7 +72,7 @@ class AuthService:
 
     Methods
     -------
-    register(username, password)
+    register(username, password, display_name)
         Регистрирует пользователя.
     login(username, password)
         Аутентифицирует пользователя и создаёт новую сессию.
@@ -93,20 +94,32 @@ class AuthService:
         self._user_repo = uow.get_repository(UserRepository)
         self._user_session_repo = uow.get_repository(UserSessionRepository)
 
-    async def register(self, create_dto: CreateUserDTO) -> None:
+    async def register(self, username: str, password: str, display_name: str) -> None:
         """Регистрирует пользователя в системе.
 
+        Хеширует пароль вне event loop и сохраняет нового пользователя.
+
         Parameters
         ----------
-        create_dto : CreateUserDTO
-            Данные для создания нового пользователя.
+        username : str
+            Логин пользователя.
+        password : str
+            Пароль пользователя в открытом виде.
+        display_name : str
+            Отображаемое имя пользователя.
 
         Raises
         ------
         UsernameAlreadyExistsException
            Пользователь с переданным username уже существует.
         """
-        await self._user_repo.create_one(create_dto)
+        await self._user_repo.create_one(
+            CreateUserDTO(
+                username=username,
+                password_hash=await hash_async(password),
+                display_name=display_name,
+            )
+        )
 
     async def login(self, username: str, password: str) -> Tokens:
         """Аутентифицирует пользователя и возвращает пару JWT.
@@ -115,7 +128,8 @@ class AuthService:
         сверяет хеш переданного пароля и сохранённый в базе данных
         хеш.
 
-        При успешной аутентификации создаёт новую сессию и возвращает
+        При успешной аутентификации удаляет истёкшие сессии пользователя,
+        создаёт новую сессию и возвращает
         пару JWT-токенов: access (короткоживущий, для заголовка
         Authorization) и refresh (долгоживущий, для HttpOnly-cookie).
 
@@ -140,7 +154,7 @@ class AuthService:
             FilterOneUserDTO(username=username), PublicAccessContext()
         )
 
-        if user is None or not verify(password, user.password_hash):
+        if user is None or not await verify_async(password, user.password_hash):
             raise IncorrectUsernameOrPasswordException(
                 detail="Incorrect username or password."
             )
@@ -153,11 +167,17 @@ class AuthService:
         refresh_token = create_jwt(
             user.id,
             current_time,
-            session_id := uuid4(),
+            session_id := uuid7(),
             token_type="refresh",
             exp=expires_at,
         )
 
+        # истёкшие сессии пользователя удаляются одним DELETE при каждом входе
+        await self._user_session_repo.delete_many(
+            FilterManyUserSessionsDTO(user_ids=[user.id], expires_before=current_time),
+            PublicAccessContext(),
+        )
+
         await self._user_session_repo.create_one(
             CreateUserSessionDTO(
                 id=session_id,
@@ -271,8 +291,7 @@ class AuthService:
         payload : AccessTokenPayload
             Полезная нагрузка (payload) access-токена текущего пользователя.
         """
-        current_ts = datetime.now(timezone.utc).timestamp()
-        ttl = ceil(payload.exp.timestamp() - current_ts)
+        ttl = ceil(payload.exp.timestamp() - time())
 
         if ttl > 0:
             await self._redis_client.revoke_token(
@@ -316,17 +335,17 @@ class AuthService:
             FilterOneUserDTO(id=payload.sub), PublicAccessContext()
         )
 
-        if user is None or not verify(current_password, user.password_hash):
+        if user is None or not await verify_async(current_password, user.password_hash):
             raise IncorrectPasswordException(detail="Current password is incorrect.")
 
-        if verify(new_password, user.password_hash):
+        if await verify_async(new_password, user.password_hash):
             raise NewPasswordSameAsOldException(
                 detail="New password must differ from current."
             )
 
         if not await self._user_repo.update_one(
             FilterOneUserDTO(id=payload.sub),
-            UpdateUserDTO(password_hash=hash_(new_password)),
+            UpdateUserDTO(password_hash=await hash_async(new_password)),
             PublicAccessContext(),
         ):
             raise PasswordUpdateFailedException(
@@ -1,4 +1,3 @@
-import asyncio
 from datetime import datetime, timezone
 from uuid import UUID
 
@@ -11,6 +10,7 @@ from app.core.exceptions.couple import (
 )
 from app.core.exceptions.user import UserNotFoundException
 from app.infra.postgres.uow import UnitOfWork
+from app.infra.redis import RedisClient
 from app.repositories.couple import CoupleRepository
 from app.repositories.couple_request import CoupleRequestRepository
 from app.repositories.interface import PublicAccessContext
@@ -37,6 +37,8 @@ class CoupleService:
 
     Attributes
     ----------
+    _redis_client : RedisClient
+        Клиент Redis для кэширования UUID партнёров.
     _user_repo : UserRepository
         Репозиторий для операций с пользователями в БД.
     _couple_repo : CoupleRepository
@@ -48,6 +50,8 @@ class CoupleService:
     -------
     get_couple(user_id)
         Получение информации о паре пользователя.
+    get_partner_id(user_id)
+        Получение UUID партнёра пользователя.
     create_couple_request(initiator_id, recipient_username)
         Создание запроса на создание пары между пользователями.
     accept_couple_request(couple_request_id, user_id)
@@ -60,7 +64,12 @@ class CoupleService:
         Обновление атрибутов пары.
     """
 
-    def __init__(self, uow: UnitOfWork):
+    _PARTNER_CACHE_TTL = 60
+    """Время в секундах, которое живёт кэш UUID партнёра пользователя."""
+
+    def __init__(self, uow: UnitOfWork, redis_client: RedisClient):
+        self._redis_client = redis_client
+
         self._user_repo = uow.get_repository(UserRepository)
         self._couple_repo = uow.get_repository(CoupleRepository)
         self._couple_request_repo = uow.get_repository(CoupleRequestRepository)
@@ -96,6 +105,38 @@ class CoupleService:
             }
         )
 
+    async def get_partner_id(self, user_id: UUID) -> UUID | None:
+        """Получение UUID партнёра пользователя.
+
+        Значение берётся из кэша Redis, а при cache miss - облегчённым
+        запросом к БД, не загружающим данные пары и пользователей.
+        В кэш попадает только найденный партнёр.
+
+        Parameters
+        ----------
+        user_id : UUID
+            UUID пользователя.
+
+        Returns
+        -------
+        UUID | None
+            UUID партнёра. None, если пользователь не состоит в паре.
+        """
+        if (cached := await self._redis_client.get_partner_id(user_id)) is not None:
+            return cached
+
+        partner_id = await self._couple_repo.read_partner_id(user_id)
+
+        # пары не расформировываются, поэтому найденный партнёр не устаревает;
+        # отсутствие пары не кэшируется - иначе чтение до коммита новой пары
+        # закрепило бы в кэше "нет партнёра"
+        if partner_id is not None:
+            await self._redis_client.set_partner_id(
+                user_id, partner_id, self._PARTNER_CACHE_TTL
+            )
+
+        return partner_id
+
     async def create_couple_request(
         self, initiator_id: UUID, recipient_username: str
     ) -> None:
@@ -135,18 +176,10 @@ class CoupleService:
                 detail=f"User with username={recipient_username} not found."
             )
 
-        first_couple, second_couple = await asyncio.gather(
-            *[
-                self._couple_repo.read_one(
-                    FilterOneCoupleDTO(user_id=user_id), PublicAccessContext()
-                )
-                for user_id in (initiator_id, recipient_user.id)
-            ],
-        )
-
-        if first_couple is not None:
+        if await self._couple_repo.read_partner_id(initiator_id) is not None:
             raise CoupleAlreadyExistsException(detail="You're already in couple!")
-        elif second_couple is not None:
+
+        if await self._couple_repo.read_partner_id(recipient_user.id) is not None:
             raise CoupleAlreadyExistsException(
                 detail=f"User with username={recipient_username} is already in couple!",
             )
@@ -1,4 +1,3 @@
-import asyncio
 from uuid import UUID
 
 from app.core.enums import DeleteErrorCode, SortOrder
@@ -109,17 +108,16 @@ class AlbumService:
             CoupleAccessContext(user_id=user_id, partner_id=partner_id),
         )
 
-        return await asyncio.gather(
-            self._album_repo.read_many(
-                filter_dto,
-                access_ctx,
-                offset=offset,
-                limit=limit,
-                sort_order=sort_order,
-            ),
-            self._album_repo.count(filter_dto, access_ctx),
+        albums = await self._album_repo.read_many(
+            filter_dto,
+            access_ctx,
+            offset=offset,
+            limit=limit,
+            sort_order=sort_order,
         )
 
+        return albums, await self._album_repo.count(filter_dto, access_ctx)
+
     async def search_albums(
         self,
         search_query: str,
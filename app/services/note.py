@@ -101,8 +101,15 @@ class NoteService:
         -------
         tuple[list[NoteDTO], int]
             Кортеж из списка заметок и общего количества.
+
+        Notes
+        -----
+        Если страница оказалась неполной (последней), общее количество
+        однозначно выводится из `offset` и размера страницы, поэтому
+        отдельный COUNT-запрос не выполняется. Подсчёт через `count_notes`
+        делается только для полных страниц и страниц за концом списка.
         """
-        return await self._note_repo.read_many(
+        notes = await self._note_repo.read_many(
             FilterManyNotesDTO(types=[note_type])
             if note_type
             else FilterManyNotesDTO(),
@@ -110,7 +117,13 @@ class NoteService:
             offset=offset,
             limit=limit,
             sort_order=sort_order,
-        ), await self.count_notes(
+        )
+
+        # неполная страница - последняя, total известен без COUNT
+        if len(notes) < limit and (notes or offset == 0):
+            return notes, offset + len(notes)
+
+        return notes, await self.count_notes(
             user_id, partner_id, [note_type] if note_type else None
         )
 
@@ -258,19 +271,13 @@ class NoteService:
             Кортеж из количества успешно удалённых заметок
             и списка ошибок для недоступных заметок.
         """
-        access_ctx = CreatorAccessContext(user_id=user_id)
-
-        existing = await self._note_repo.read_many(
-            FilterManyNotesDTO(ids=note_ids), access_ctx, limit=len(note_ids)
-        )
-        existing_ids = {note.id for note in existing}
-
-        deleted = 0
-        if existing_ids:
-            deleted = await self._note_repo.delete_many(
-                FilterManyNotesDTO(ids=list(existing_ids)), access_ctx
+        deleted_ids = set(
+            await self._note_repo.delete_many_returning_ids(
+                FilterManyNotesDTO(ids=note_ids), CreatorAccessContext(user_id=user_id)
             )
+        )
 
+        if deleted := len(deleted_ids):
             await self._redis_client.decrement_count("notes", user_id, amount=deleted)
 
         return deleted, [
@@ -280,5 +287,5 @@ class NoteService:
                 message=f"Note with id={note_id} not found, or you're not this note's creator.",
             )
             for note_id in note_ids
-            if note_id not in existing_ids
+            if note_id not in deleted_ids
         ]
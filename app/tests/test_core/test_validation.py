@@ -0,0 +1,40 @@
+import pytest
+from pydantic import BaseModel, ValidationError
+
+from app.core.consts import URL_MAX_LENGTH
+from app.core.validation import ValidatedHttpUrl
+
+
+class _UrlModel(BaseModel):
+    url: ValidatedHttpUrl
+
+
+class TestValidatedHttpUrl:
+    """Тесты аннотации ValidatedHttpUrl."""
+
+    def test_valid_url_is_normalized(self):
+        """Корректная ссылка возвращается в нормализованном виде."""
+        model = _UrlModel(url="https://Example.com/a b")
+
+        assert model.url == "https://example.com/a%20b"
+
+    def test_non_http_scheme_rejected(self):
+        """Ссылка со схемой, отличной от http(s), отклоняется."""
+        with pytest.raises(ValidationError):
+            _UrlModel(url="ftp://example.com/file")
+
+    def test_url_at_limit_accepted(self):
+        """Ссылка длиной ровно URL_MAX_LENGTH после нормализации принимается."""
+        prefix = "https://e.com/"
+        url = prefix + "a" * (URL_MAX_LENGTH - len(prefix))
+
+        assert _UrlModel(url=url).url == url
+
+    def test_url_growing_past_limit_after_normalization_rejected(self):
+        """Ссылка, удлиняющаяся при percent-encoding сверх лимита, отклоняется."""
+        url = "https://e.com/" + "a b" * 160
+
+        assert len(url) <= URL_MAX_LENGTH
+
+        with pytest.raises(ValidationError):
+            _UrlModel(url=url)
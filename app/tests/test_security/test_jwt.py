@@ -3,9 +3,12 @@ from uuid import uuid4
 
 import pytest
 from cryptography.exceptions import InvalidTag
+from jose import ExpiredSignatureError, JWTError
 
 from app.config import Settings, get_settings
+from app.core import security
 from app.core.security import (
+    construct_payload,
     create_jwt,
     create_jwt_pair,
     decrypt_data,
@@ -14,10 +17,32 @@ from app.core.security import (
     jwt_decode,
     verify,
 )
+from app.core.types import TokenType
 
 settings: Settings = get_settings()
 
 
+@pytest.fixture(autouse=True)
+def clear_access_payloads():
+    """Очищает кэш проверенных access-токенов до и после каждого теста."""
+    security._access_payloads.clear()
+    yield
+    security._access_payloads.clear()
+
+
+def _make_token(
+    token_type: TokenType, expires_delta: timedelta = timedelta(minutes=5)
+) -> str:
+    """Создаёт подписанный JWT заданного типа для тестов кэша."""
+    return create_jwt(
+        uuid4(),
+        datetime.now(timezone.utc),
+        uuid4(),
+        token_type=token_type,
+        expires_delta=expires_delta,
+    )
+
+
 class TestPasswordHashing:
     """Тесты функций хеширования и верификации паролей."""
 
@@ -158,6 +183,76 @@ class TestJWTTokens:
             jwt_decode(invalid_token)
 
 
+class TestAccessPayloadCache:
+    """Тесты кэша payload проверенных access-токенов в `jwt_decode`."""
+
+    def test_repeat_decode_served_from_cache(self, monkeypatch):
+        """Повторное декодирование access-токена не проверяет подпись."""
+        token = _make_token("access")
+        first = jwt_decode(token, "access")
+
+        def fail_decode(*args, **kwargs):
+            raise AssertionError("jwt.decode must not be called on cache hit")
+
+        monkeypatch.setattr(security.jwt, "decode", fail_decode)
+
+        assert jwt_decode(token, "access") is first
+
+    def test_expired_cached_entry_removed(self):
+        """Истёкшая запись удаляется, а токен проходит штатную проверку."""
+        payload = construct_payload(
+            uuid4(),
+            datetime.now(timezone.utc) - timedelta(minutes=10),
+            uuid4(),
+            token_type="access",
+            expires_delta=timedelta(minutes=5),
+        )
+        token = create_jwt(payload, token_type="access")
+        security._access_payloads[token] = payload
+
+        with pytest.raises(ExpiredSignatureError):
+            jwt_decode(token, "access")
+
+        assert token not in security._access_payloads
+
+    def test_oldest_entry_evicted_at_capacity(self, monkeypatch):
+        """При заполнении кэша вытесняется самая старая запись."""
+        monkeypatch.setattr(security, "_ACCESS_PAYLOAD_CACHE_SIZE", 2)
+        tokens = [_make_token("access") for _ in range(3)]
+
+        for token in tokens:
+            jwt_decode(token, "access")
+
+        assert list(security._access_payloads) == tokens[1:]
+
+    def test_refresh_token_not_cached(self):
+        """Payload refresh-токена никогда не кэшируется."""
+        jwt_decode(_make_token("refresh"), "refresh")
+
+        assert not security._access_payloads
+
+    def test_tampered_token_misses_cache(self):
+        """Изменённый токен не попадает в кэш и не проходит проверку подписи."""
+        token = _make_token("access")
+        jwt_decode(token, "access")
+
+        header, body, signature = token.split(".")
+        middle = len(signature) // 2
+        tampered_char = "A" if signature[middle] != "A" else "B"
+        tampered = ".".join(
+            (
+                header,
+                body,
+                signature[:middle] + tampered_char + signature[middle + 1 :],
+            )
+        )
+
+        with pytest.raises(JWTError):
+            jwt_decode(tampered, "access")
+
+        assert tampered not in security._access_payloads
+
+
 class TestEncryption:
     """Тесты функций шифрования данных."""
 
@@ -1 +1,65 @@
-# Tests for couples service business logic
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from app.infra.postgres.uow import UnitOfWork
+from app.services.couple import CoupleService
+
+
+class TestCoupleServiceGetPartnerId:
+    """Тесты метода get_partner_id сервиса CoupleService."""
+
+    @staticmethod
+    def _make_service(
+        read_partner_id: AsyncMock, mock_redis_client: MagicMock
+    ) -> CoupleService:
+        uow = MagicMock(spec=UnitOfWork)
+
+        mock_repo = MagicMock()
+        mock_repo.read_partner_id = read_partner_id
+        uow.get_repository = MagicMock(return_value=mock_repo)
+
+        return CoupleService(uow, mock_redis_client)
+
+    @pytest.mark.asyncio
+    async def test_cached_partner_skips_db(self):
+        """Партнёр из кэша возвращается без запроса к БД."""
+        partner_id = uuid4()
+
+        redis_client = MagicMock()
+        redis_client.get_partner_id = AsyncMock(return_value=partner_id)
+        read_partner_id = AsyncMock()
+
+        service = self._make_service(read_partner_id, redis_client)
+
+        assert await service.get_partner_id(uuid4()) == partner_id
+        read_partner_id.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_found_partner_is_cached(self):
+        """Найденный в БД партнёр сохраняется в кэш."""
+        user_id, partner_id = uuid4(), uuid4()
+
+        redis_client = MagicMock()
+        redis_client.get_partner_id = AsyncMock(return_value=None)
+        redis_client.set_partner_id = AsyncMock()
+
+        service = self._make_service(AsyncMock(return_value=partner_id), redis_client)
+
+        assert await service.get_partner_id(user_id) == partner_id
+        redis_client.set_partner_id.assert_called_once_with(
+            user_id, partner_id, CoupleService._PARTNER_CACHE_TTL
+        )
+
+    @pytest.mark.asyncio
+    async def test_missing_partner_is_not_cached(self):
+        """Отсутствие пары не записывается в кэш."""
+        redis_client = MagicMock()
+        redis_client.get_partner_id = AsyncMock(return_value=None)
+        redis_client.set_partner_id = AsyncMock()
+
+        service = self._make_service(AsyncMock(return_value=None), redis_client)
+
+        assert await service.get_partner_id(uuid4()) is None
+        redis_client.set_partner_id.assert_not_called()